@@ -12,9 +12,14 @@ import logging
 import queue
 import re
 import random
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 # Image + network
+# Pillow-SIMD installs under the same PIL namespace; building the .exe against it speeds up every resample
+# below with no code changes (pip uninstall pillow && pip install pillow-simd)
 from PIL import Image, ImageTk, ImageDraw, ImageFilter
 from collections import OrderedDict
 
@@ -35,12 +40,34 @@ IS_WINDOWS = (os.name == "nt")
 if IS_WINDOWS:
     try:
         import ctypes
-        USER32 = ctypes.windll.user32
+        from ctypes import wintypes
+        # A private handle: prototypes set on the shared ctypes.windll.user32 would leak into every other module
+        USER32 = ctypes.WinDLL("user32", use_last_error=True)
+        # Declared prototypes skip ctypes' per-call argument guessing and keep HWND/LONG_PTR values pointer-sized
+        HWND, LONG_PTR = wintypes.HWND, ctypes.c_ssize_t
+        WNDENUMPROC = ctypes.WINFUNCTYPE(wintypes.BOOL, HWND, wintypes.LPARAM)
+        if sys.maxsize > 2**32: GetWindowLongPtr, SetWindowLongPtr = USER32.GetWindowLongPtrW, USER32.SetWindowLongPtrW
+        else: GetWindowLongPtr, SetWindowLongPtr = USER32.GetWindowLongW, USER32.SetWindowLongW
+        for fn, args, res in (
+            (USER32.GetAsyncKeyState, [ctypes.c_int], ctypes.c_short),
+            (USER32.SetWindowPos, [HWND, HWND, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int, wintypes.UINT], wintypes.BOOL),
+            (USER32.GetParent, [HWND], HWND),
+            (GetWindowLongPtr, [HWND, ctypes.c_int], LONG_PTR),
+            (SetWindowLongPtr, [HWND, ctypes.c_int, LONG_PTR], LONG_PTR),
+            (USER32.EnumWindows, [WNDENUMPROC, wintypes.LPARAM], wintypes.BOOL),
+            (USER32.GetWindowTextW, [HWND, wintypes.LPWSTR, ctypes.c_int], ctypes.c_int),
+            (USER32.GetWindowTextLengthW, [HWND], ctypes.c_int),
+            (USER32.IsWindowVisible, [HWND], wintypes.BOOL),
+            (USER32.ShowWindow, [HWND, ctypes.c_int], wintypes.BOOL),
+            (USER32.SetForegroundWindow, [HWND], wintypes.BOOL),
+            (USER32.keybd_event, [ctypes.c_ubyte, ctypes.c_ubyte, wintypes.DWORD, ctypes.c_size_t], None),
+        ):
+            fn.argtypes, fn.restype = args, res
         VK_MEDIA_NEXT_TRACK, VK_MEDIA_PREV_TRACK = 0xB0, 0xB1
         VK_VOLUME_DOWN, VK_VOLUME_UP = 0xAE, 0xAF
         KEYEVENTF_KEYUP = 0x0002
         NATIVE_CONTROLS_AVAILABLE = True
-    except (ImportError, AttributeError):
+    except (ImportError, AttributeError, OSError):
         NATIVE_CONTROLS_AVAILABLE = False
 else:
     NATIVE_CONTROLS_AVAILABLE = False
@@ -60,6 +87,10 @@ GEOMETRY_FILE = USER_DIR / "geometry.json"
 
 ICON_CACHE_DIR = USER_DIR / ".icon_cache"
 ICON_CACHE_DIR.mkdir(exist_ok=True)
+ART_CACHE_DIR = USER_DIR / ".art_cache"
+ART_CACHE_DIR.mkdir(exist_ok=True)
+ART_CACHE_MAX_FILES = 64
+_ART_PRUNE_LOCK = threading.Lock()
 
 # Point ASSETS to the hidden bundled folder
 ASSETS_DIR = BUNDLE_DIR / "assets"
@@ -78,6 +109,15 @@ CORNER_RADIUS = 24
 OVERLAY_ALPHA = 0.5
 FONT_NAME = "Segoe UI"
 DISABLE_IMAGES = os.getenv("DISABLE_IMAGES", "0") == "1"
+MEDIA_POLL_DELAY_S = 0.3      # Media loop cadence while something is playing
+IDLE_POLL_DELAY_S = 1.0       # Backed-off cadence while paused or with no session
+MEDIA_PROPS_MAX_AGE_S = 3.0  # Re-read media properties at least this often, even without a change event
+MEDIA_ERROR_MAX_DELAY_S = 8.0 # Ceiling for the error backoff when the session manager keeps failing
+WIND_IDLE_POLL_S, WIND_ARMED_POLL_S = 0.025, 0.005  # Win+D watcher cadence without / with a Win key held
+QUEUE_SAFETY_MS = 1000                  # With threaded Tcl every post wakes the consumer; this tick is only a safety net
+QUEUE_BUSY_MS, QUEUE_IDLE_MS = 16, 100  # Unthreaded Tcl can't be woken from workers: cadence while busy / once quiet
+QUEUE_IDLE_TICKS = 10                   # Empty busy ticks before backing off to the idle cadence
+PROGRESS_TICK_MS, PROGRESS_PAUSED_MS = 100, 500  # Progress bar cadence while playing / while paused
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
 
@@ -85,42 +125,133 @@ class LRUCache(OrderedDict):
     def __init__(self, max_size=10):
         super().__init__()
         self.max_size = max_size
+    # Caches are shared by the Tk thread and the art executor; each dict call is atomic under the GIL,
+    # but a check followed by a separate move is not, so misses surface as KeyError instead
+    def get(self, key, default=None):
+        # A hit counts as a use, so eviction drops the least recently read entry rather than the oldest write
+        try:
+            self.move_to_end(key)
+            return super().__getitem__(key)
+        except KeyError: return default
     def __setitem__(self, key, value):
-        if key in self: self.move_to_end(key)
+        try: self.move_to_end(key)
+        except KeyError: pass
         super().__setitem__(key, value)
         if len(self) > self.max_size: self.popitem(last=False)
 
+# Rounded-rect alpha masks depend only on geometry, so overlays and album art share them
+_MASK_CACHE = LRUCache(max_size=24)
+
+def rounded_mask(size: Tuple[int, int], radius: int, width: int = 0) -> Image.Image:
+    """Cached "L" mask of a filled (width=0) or outlined rounded rect. Callers must not modify it."""
+    key = (size, radius, width)
+    if (mask := _MASK_CACHE.get(key)) is None:
+        mask = Image.new("L", size, 0)
+        if width: ImageDraw.Draw(mask).rounded_rectangle((0, 0) + size, radius, outline=255, width=width)
+        else: ImageDraw.Draw(mask).rounded_rectangle((0, 0) + size, radius, fill=255)
+        _MASK_CACHE[key] = mask
+    return mask
+
+class AlbumArtCache:
+    """Decoded thumbnails keyed by a digest of their raw bytes, so a revisited
+    album skips the image decode and full-frame comparison."""
+    def __init__(self, max_size=64):
+        self._images = LRUCache(max_size=max_size)
+
+    def get_or_decode(self, data) -> Tuple[str, Image.Image]:
+        key = hashlib.blake2b(data, digest_size=16).hexdigest()
+        img = self._images.get(key)
+        if img is None:
+            # open_art closes the source right after conversion so the encoded copy is freed immediately
+            img = open_art(io.BytesIO(data))
+            self._images[key] = img
+        return key, img
+
+def drawn_track_key(state: Dict[str, Any]) -> Tuple:
+    """The fields the track content is drawn from; position and play state are excluded, since the
+    progress bar and play indicators update those in place."""
+    return (state.get("title"), state.get("artist"), state.get("app"), state.get("app_domain"),
+            state.get("art_key"), state.get("image") is not None)
+
 def format_ms(ms: float) -> str:
     seconds = int(max(0, ms) / 1000)
     minutes = seconds // 60
     seconds %= 60
     return f"{minutes:02d}:{seconds:02d}"
 
+def interpolate_progress_ms(state: Dict[str, Any], playing: bool, now: float) -> float:
+    """Last reported position plus the wall time elapsed since it was reported, while playing."""
+    progress = state.get("progress_ms", 0)
+    if playing: progress += (now - state.get("last_update_time", now)) * 1000
+    return progress
+
 def safe_filename(name: str) -> str:
     return re.sub(r'[\\/*?:"<>|]', "", name)
 
-def create_rounded_image(pil_image: Image.Image, size: Tuple[int, int], radius: int) -> Image.Image:
-    mask = Image.new("L", size, 0)
-    draw = ImageDraw.Draw(mask)
-    draw.rounded_rectangle((0, 0) + size, radius, fill=255)
-    output = pil_image.resize(size, Image.Resampling.LANCZOS)
-    output.putalpha(mask)
-    return output
+# Large downscales first BOX-reduce to within this factor of the target, so the final filter only covers a small footprint
+ART_REDUCING_GAP = 2.0
+
+def resample_filter(src_size: Tuple[int, int], dst_size: Tuple[int, int]) -> int:
+    """LANCZOS for heavy downscales; BICUBIC is visually identical within 2x and much cheaper.
+    LOW_END_MODE trades the last bit of sharpness for BILINEAR everywhere."""
+    if LOW_END_MODE: return Image.Resampling.BILINEAR
+    if src_size[0] <= dst_size[0] * 2 and src_size[1] <= dst_size[1] * 2:
+        return Image.Resampling.BICUBIC
+    return Image.Resampling.LANCZOS
+
+def open_art(src) -> Image.Image:
+    """Decodes art at no more than widget resolution. For JPEGs, draft() lets libjpeg
+    downscale during decode, so oversized covers never get fully expanded."""
+    with Image.open(src) as img:
+        img.draft("RGB", (MAX_WIDGET_SIZE, MAX_WIDGET_SIZE))
+        # Opaque covers stay 3-band: round_corners adds the only alpha they need, and every
+        # resample and blur before that moves a quarter less data
+        has_alpha = "A" in img.getbands() or "transparency" in img.info
+        return bound_to_widget(img.convert("RGBA" if has_alpha else "RGB"))
+
+def bound_to_widget(img: Image.Image) -> Image.Image:
+    """Shrink decoded art once so its short side is at most MAX_WIDGET_SIZE; every later resample starts smaller."""
+    scale = MAX_WIDGET_SIZE / min(img.size)
+    if scale >= 1: return img
+    size = (max(1, round(img.width * scale)), max(1, round(img.height * scale)))
+    return img.resize(size, resample_filter(img.size, size), reducing_gap=ART_REDUCING_GAP)
+
+def round_corners(img: Image.Image, radius: int) -> Image.Image:
+    """Applies the rounded-rect alpha to img in place; only for images the caller owns."""
+    img.putalpha(rounded_mask(img.size, radius))
+    return img
+
+def small_art_geometry(w: int, h: int) -> Tuple[int, int]:
+    """Side and corner radius of the small cover for a widget size."""
+    art_size = int(min(w, h) * 0.28)
+    return art_size, int(art_size * 0.15)
+
+def build_bg_art(pil_art: Image.Image, size: Tuple[int, int]) -> Image.Image:
+    # crop_center_fill and filter both return fresh images at the final size, so round them in place
+    return round_corners(crop_center_fill(pil_art, *size).filter(ImageFilter.GaussianBlur(6)), CORNER_RADIUS)
+
+def build_small_art(pil_art: Image.Image, art_size: int, radius: int) -> Image.Image:
+    return round_corners(crop_center_fill(pil_art, art_size, art_size), radius)
 
 def crop_center_fill(img: Image.Image, target_w: int, target_h: int) -> Image.Image:
+    """Returns a new image; the source is never modified, so callers can pass cached art directly."""
     img_ratio = img.width / img.height
     target_ratio = target_w / target_h
     if img_ratio > target_ratio:
         new_w = int(target_ratio * img.height)
         left = (img.width - new_w) // 2
-        img = img.crop((left, 0, left + new_w, img.height))
+        box = (left, 0, left + new_w, img.height)
     else:
         new_h = int(img.width / target_ratio)
         top = (img.height - new_h) // 2
-        img = img.crop((0, top, img.width, top + new_h))
-    return img.resize((target_w, target_h), Image.Resampling.LANCZOS)
+        box = (0, top, img.width, top + new_h)
+    # Resample straight from the source region instead of materialising a cropped copy first
+    src_size = (box[2] - box[0], box[3] - box[1])
+    return img.resize((target_w, target_h), resample_filter(src_size, (target_w, target_h)), box=box, reducing_gap=ART_REDUCING_GAP)
 
+@lru_cache(maxsize=32)
 def get_app_domain_and_name(app_id: str) -> Tuple[str, str]:
+    """Badge domain and display name for an SMTC app id; memoised since the poll asks for every session each tick."""
     app_id = str(app_id).lower()
     if "spotify" in app_id: return "spotify", "Spotify"
     if "brave" in app_id: return "brave", "Brave"
@@ -146,13 +277,56 @@ def get_local_cover_art(title: str) -> Optional[Image.Image]:
     for ext in ['.png', '.jpg', '.jpeg']:
         path = COVERS_DIR / f"{safe_title}{ext}"
         if path.exists():
-            try: return Image.open(path).convert("RGBA")
+            try: return open_art(path)
             except: pass
     return None
 
+def _art_cache_stem(track_id: Tuple[str, str, str]) -> str:
+    return hashlib.blake2b(repr(track_id).encode("utf-8"), digest_size=12).hexdigest()
+
+def load_cached_art(track_id: Tuple[str, str, str]) -> Optional[Tuple[str, Image.Image]]:
+    """Last art seen for (app, title, artist) in an earlier session, with the digest key it had then."""
+    path = next(ART_CACHE_DIR.glob(f"{_art_cache_stem(track_id)}_*.png"), None)
+    if path is None: return None
+    try: return path.stem.split("_", 1)[1], open_art(path)
+    except Exception: return None
+
+def store_cached_art(track_id: Tuple[str, str, str], art_key: str, img: Image.Image):
+    stem = _art_cache_stem(track_id)
+    path = ART_CACHE_DIR / f"{stem}_{art_key}.png"
+    if path.exists(): return
+    try:
+        for old in ART_CACHE_DIR.glob(f"{stem}_*.png"): old.unlink(missing_ok=True)
+        # Fast PNG compression: this is a scratch cache, and the write happens once per new cover
+        img.save(path, "PNG", compress_level=1)
+    except Exception as e: logging.warning(f"Could not cache art: {e}")
+    # Keep the cap on long-running sessions too, not just at startup
+    prune_art_cache()
+
+def prune_art_cache(max_files: int = ART_CACHE_MAX_FILES):
+    """Drops the least recently written covers beyond max_files."""
+    # Stores run on the multi-threaded default executor; a prune already in progress covers this one
+    if not _ART_PRUNE_LOCK.acquire(blocking=False): return
+    try:
+        dated = []
+        for f in ART_CACHE_DIR.glob("*.png"):
+            # A store may replace a track's file between the glob and the stat
+            try: dated.append((f.stat().st_mtime, f))
+            except FileNotFoundError: pass
+        dated.sort(reverse=True)
+        for _, old in dated[max_files:]: old.unlink(missing_ok=True)
+    except Exception as e: logging.warning(f"Could not prune art cache: {e}")
+    finally: _ART_PRUNE_LOCK.release()
+
+@lru_cache(maxsize=16)
+def get_font(font_tuple: Tuple) -> font.Font:
+    """One Tk font object per tuple, instead of a new named font for every measurement."""
+    return font.Font(family=font_tuple[0], size=font_tuple[1], weight=font_tuple[2] if len(font_tuple)>2 else "normal")
+
+@lru_cache(maxsize=64)
 def truncate_text(text: str, font_tuple: Tuple, max_width: int) -> str:
     if not text: return ""
-    f = font.Font(family=font_tuple[0], size=font_tuple[1], weight=font_tuple[2] if len(font_tuple)>2 else "normal")
+    f = get_font(font_tuple)
     if f.measure(text) <= max_width: return text
     while len(text) > 0 and f.measure(text + "...") > max_width: text = text[:-1]
     return text + "..."
@@ -162,6 +336,8 @@ def install_tk_excepthook(root: tk.Misc):
     root.report_callback_exception = handler
 
 class UniversalMediaWidget:
+    _rgb_cache: Dict[str, Tuple[int, int, int]] = {}
+
     def __init__(self, root: tk.Tk):
         self.root = root
         self.widget_width, self.widget_height = INITIAL_WIDGET_WIDTH, INITIAL_WIDGET_HEIGHT
@@ -170,7 +346,11 @@ class UniversalMediaWidget:
         self.drag_locked = False
         self._is_resizing, self._resize_start_pos, self._start_size = False, None, None
         self._resize_mode = None
-        self._cmd_queue: "queue.Queue[Tuple[str, Any]]" = queue.Queue()
+        # Only handoff between the worker threads and Tk; SimpleQueue skips Queue's condition-variable bookkeeping
+        self._cmd_queue: "queue.SimpleQueue[Tuple[str, Any]]" = queue.SimpleQueue()
+        self._queue_idle_ticks, self._queue_kick_pending = 0, False
+        # Threaded Tcl (the CPython default) marshals Tk calls made from other threads onto the Tk thread
+        self._tk_threaded = bool(int(self.root.tk.call("info", "exists", "tcl_platform(threaded)")))
         self._after_ids = {}
         
         self.opacity = 1.0
@@ -193,7 +373,7 @@ class UniversalMediaWidget:
 
         # Cache the OS-level HWND here for our background thread
         if IS_WINDOWS:
-            self._hwnd = ctypes.windll.user32.GetParent(self.root.winfo_id())
+            self._hwnd = USER32.GetParent(self.root.winfo_id())
 
         # Bring the window back safely FIRST
         self.root.deiconify()
@@ -225,15 +405,45 @@ class UniversalMediaWidget:
         self._action_lock_time = 0.0 
         self._locked_app_id = None
         
-        self._state_lock, self._media_state = threading.Lock(), {}
+        # Only the Tk thread assigns _media_state, always as a fresh dict; the media loop reads it and posts replacements
+        self._media_state = {}
         self.tk_image_references: Dict[str, ImageTk.PhotoImage] = {}
         self._overlay_cache = LRUCache(max_size=20)
+        self._ctrl_sprites = LRUCache(max_size=8)
+        self._icon_sprites = LRUCache(max_size=16)
+        self._grip_photo = None
+        self._layout_cache = LRUCache(max_size=8)
+        self._art_photo_cache = LRUCache(max_size=12)
+        self._pending_resize_id = None
+        self._pending_move, self._move_idle_id = None, None
+        self._chrome_key = None
+        self._chrome_items = {}
+        self._drawn_inputs = None
+        self._eq_pos = None
+        self._progress_visible = self._progress_details_shown = False
+        self._progress_labels = self._progress_fg_x = self._progress_ball_x = None
+        self._controls_playing = False
+        self._album_art_cache = AlbumArtCache()
+        self._art_by_track = LRUCache(max_size=16)
         
         self._song_history = []
         self._slideshow_idx = 0
         self.menu_icons = {} 
+        self._context_menu, self._context_menu_app = None, None
         
         self._stop_event = threading.Event()
+        
+        # One long-lived loop runs the media poll and every control click, so WinRT IO waits interleave on one thread
+        self._async_loop = asyncio.new_event_loop()
+        threading.Thread(target=self._async_loop.run_forever, daemon=True, name="MediaAsyncLoop").start()
+        # Blocking Win32 work from clicks (window search, app launch, volume keys) reuses one thread
+        self._ctrl_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="WidgetCtrl")
+        self._session_mgr = None
+        self._media_props = {}
+        self._media_props_dirty = set()
+        self._shared_props_seen = {}
+        self._media_sessions_changed = False  # Set from the manager's SessionsChanged event; drops every cached entry
+        self._poll_wakeup = None  # asyncio.Event owned by the media loop; set when a control should be re-read right away
         self._bind_events()
         
         self._run_startup_animation()
@@ -245,21 +455,14 @@ class UniversalMediaWidget:
             WS_EX_TOOLWINDOW = 0x00000080
             WS_EX_APPWINDOW = 0x00040000
             
-            is_64bits = sys.maxsize > 2**32
-            if is_64bits:
-                GetWindowLong = ctypes.windll.user32.GetWindowLongPtrW
-                SetWindowLong = ctypes.windll.user32.SetWindowLongPtrW
-            else:
-                GetWindowLong = ctypes.windll.user32.GetWindowLongW
-                SetWindowLong = ctypes.windll.user32.SetWindowLongW
-                
-            style = GetWindowLong(self._hwnd, GWL_EXSTYLE)
+            style = GetWindowLongPtr(self._hwnd, GWL_EXSTYLE)
             style = (style & ~WS_EX_APPWINDOW) | WS_EX_TOOLWINDOW
-            SetWindowLong(self._hwnd, GWL_EXSTYLE, style)
+            SetWindowLongPtr(self._hwnd, GWL_EXSTYLE, style)
         except Exception as e:
             logging.error(f"Failed to set ToolWindow style: {e}")
 
     def _load_config(self):
+        self._saved_config = None
         if CONFIG_FILE.exists():
             try:
                 with open(CONFIG_FILE, "r") as f:
@@ -268,10 +471,14 @@ class UniversalMediaWidget:
                     self.is_pinned = data.get("PINNED", False)
                     self.drag_locked = data.get("LOCKED", False)
                     self.play_startup_sound = data.get("PLAY_STARTUP_SOUND", True)
+                    self._saved_config = data
             except Exception: pass
 
     def _save_config(self):
-        with open(CONFIG_FILE, "w") as f: json.dump({"OPACITY": self.opacity, "PINNED": self.is_pinned, "LOCKED": self.drag_locked, "PLAY_STARTUP_SOUND": self.play_startup_sound}, f)
+        config = {"OPACITY": self.opacity, "PINNED": self.is_pinned, "LOCKED": self.drag_locked, "PLAY_STARTUP_SOUND": self.play_startup_sound}
+        if config == self._saved_config: return
+        with open(CONFIG_FILE, "w") as f: json.dump(config, f)
+        self._saved_config = config
 
     def _run_startup_animation(self):
         self.canvas.delete("all")
@@ -281,13 +488,13 @@ class UniversalMediaWidget:
         font_size = max(14, min(self.widget_width, self.widget_height) // 10)
         intro_font = (FONT_NAME, font_size, "bold")
         
-        total_width = sum(font.Font(family=FONT_NAME, size=font_size, weight="bold").measure(l) for l in letters)
+        total_width = sum(get_font(intro_font).measure(l) for l in letters)
         start_x = (self.widget_width - total_width) / 2
         
         letter_positions = []
         current_x = start_x
         for letter in letters:
-            letter_width = font.Font(family=FONT_NAME, size=font_size, weight="bold").measure(letter)
+            letter_width = get_font(intro_font).measure(letter)
             letter_positions.append({'char': letter, 'x': current_x, 'y': -font_size, 'final_y': self.widget_height / 2 - 10, 'id': None})
             current_x += letter_width
 
@@ -334,10 +541,11 @@ class UniversalMediaWidget:
             winsound.PlaySound(str(sound_file), winsound.SND_FILENAME | winsound.SND_ASYNC)
 
     def _start_main_app(self):
+        self._chrome_key = self._drawn_inputs = None  # The first refresh must clear the intro animation
         self._queue_command("refresh")
         self._start_background_tasks()
-        self._schedule_task("queue_consumer", 16, self._process_cmd_queue)
-        self._schedule_task("progress_bar", 50, self._animate_progress_bar)
+        self._pump_cmd_queue()
+        self._progress_tick()
         self._schedule_task("eq_anim", 100, self._animate_eq_bars)
 
     def _fast_win_d_monitor(self):
@@ -346,6 +554,7 @@ class UniversalMediaWidget:
         SWP_NOSIZE = 0x0001
         
         while not self._stop_event.is_set():
+            lwin = rwin = 0
             try:
                 lwin = USER32.GetAsyncKeyState(0x5B) & 0x8000
                 rwin = USER32.GetAsyncKeyState(0x5C) & 0x8000
@@ -358,7 +567,8 @@ class UniversalMediaWidget:
                         self.root.after(800, self._restore_after_wind)
             except Exception:
                 pass
-            time.sleep(0.005)
+            # Only a held Win key can start the chord, so poll fast just while one is down
+            if self._stop_event.wait(WIND_ARMED_POLL_S if lwin or rwin else WIND_IDLE_POLL_S): break
 
     def _restore_after_wind(self):
         self._is_surviving_wind = False
@@ -377,9 +587,11 @@ class UniversalMediaWidget:
             self.root.wm_attributes("-topmost", True)
 
     def _load_geometry(self):
+        self._saved_geometry = None
         try:
             if GEOMETRY_FILE.exists():
                 with open(GEOMETRY_FILE, "r") as f: geom = json.load(f)
+                self._saved_geometry = geom
                 w, h = geom.get("width", INITIAL_WIDGET_WIDTH), geom.get("height", INITIAL_WIDGET_HEIGHT)
                 x, y = geom.get("x"), geom.get("y")
                 self.widget_width = max(MIN_WIDGET_SIZE, min(MAX_WIDGET_SIZE, w))
@@ -392,7 +604,10 @@ class UniversalMediaWidget:
     def _save_geometry(self):
         try:
             geom = {"width": self.root.winfo_width(), "height": self.root.winfo_height(), "x": self.root.winfo_x(), "y": self.root.winfo_y()}
+            # Saves fire after every drag and on exit; skip the disk write when nothing moved
+            if geom == self._saved_geometry: return
             with open(GEOMETRY_FILE, "w") as f: json.dump(geom, f, indent=4)
+            self._saved_geometry = geom
         except Exception: pass
 
     def _schedule_task(self, name, delay_ms, callback, *args):
@@ -404,14 +619,87 @@ class UniversalMediaWidget:
             if name not in ["save_geometry", "slideshow"]: self._after_ids[name] = self.root.after(delay_ms, w)
         self._after_ids[name] = self.root.after(delay_ms, w)
 
-    def _queue_command(self, cmd, payload=None): self._cmd_queue.put((cmd, payload))
+    def _queue_command(self, cmd, payload=None):
+        self._cmd_queue.put((cmd, payload))
+        if self._queue_kick_pending or "queue_consumer" not in self._after_ids: return
+        if not self._tk_threaded and threading.current_thread() is not threading.main_thread(): return
+        # Every post drains on the next idle pass of the Tk thread; from a worker the after_idle call is
+        # marshalled by Tcl, so the consumer sleeps until there is actually something to handle.
+        # A racing second kick from another thread is harmless: the extra drain finds the queue empty.
+        self._queue_kick_pending = True
+        try: self.root.after_idle(self._kick_cmd_queue)
+        except (RuntimeError, tk.TclError): self._queue_kick_pending = False  # Tk is gone; we're shutting down
+
+    def _kick_cmd_queue(self):
+        self._queue_kick_pending = False
+        self._queue_idle_ticks = 0
+        self._process_cmd_queue()
+
+    def _pump_cmd_queue(self):
+        # Without worker wakeups the timer is the only consumer, so it backs off once the queue goes quiet
+        self._queue_idle_ticks = 0 if self._process_cmd_queue() else self._queue_idle_ticks + 1
+        if self._tk_threaded: delay = QUEUE_SAFETY_MS
+        else: delay = QUEUE_BUSY_MS if self._queue_idle_ticks < QUEUE_IDLE_TICKS else QUEUE_IDLE_MS
+        self._after_ids["queue_consumer"] = self.root.after(delay, self._pump_cmd_queue)
     
-    def _process_cmd_queue(self):
-        for _ in range(5):
+    def _process_cmd_queue(self) -> int:
+        # Messages of the same kind collapse to their net effect: progress updates merge (a newer
+        # track state supersedes them) and only the latest session list is kept
+        refresh, progress, sessions = False, None, None
+        handled = 0
+        for _ in range(20):
             try:
                 cmd, payload = self._cmd_queue.get_nowait()
-                if cmd == "refresh": self.update_ui_with_state()
+                handled += 1
+                if cmd == "refresh": refresh = True
+                elif cmd == "state": self._apply_media_state(*payload); refresh = True; progress = None
+                elif cmd == "progress": progress = ({**progress[0], **payload[0]}, payload[1]) if progress else payload
+                elif cmd == "sessions": sessions = payload
+                elif cmd == "art": self._install_art(payload)
             except queue.Empty: break
+        if progress:
+            # A play/pause made outside the widget arrives as a progress update; repaint its indicators
+            if progress[1] != self.is_playing: refresh = True
+            self._apply_progress(*progress)
+        if sessions is not None: self._available_sessions = sessions
+        # However many redraws were requested since the last tick, repaint once, and only if something changed
+        if refresh and not self._ui_is_current(): self.update_ui_with_state()
+        return handled
+
+    def _ui_is_current(self) -> bool:
+        """True when the canvas already shows this track, playback flag, size and toggles."""
+        drawn = self._drawn_inputs
+        if drawn is None or drawn[0] != drawn_track_key(self._media_state): return False
+        if self._pending_resize_id is not None: size = (self.widget_width, self.widget_height)
+        else: size = (self.root.winfo_width(), self.root.winfo_height())
+        return drawn[1:] == (self.is_playing, *size, self.is_pinned, self.drag_locked)
+
+    def _install_art(self, rendered):
+        # PhotoImage must be created on the Tk thread; the resampling behind it already happened on the media loop
+        for key, img in rendered.items():
+            if key not in self._art_photo_cache: self._art_photo_cache[key] = ImageTk.PhotoImage(img)
+
+    def _prerender_art(self, pil_art, art_key) -> Dict[Tuple, Image.Image]:
+        """Backdrop and small cover for the current size, built off the Tk thread under the keys the draw code looks up."""
+        w, h = self.widget_width, self.widget_height
+        art_size, radius = small_art_geometry(w, h)
+        return {
+            ("bg", art_key, (w, h)): build_bg_art(pil_art, (w, h)),
+            ("small", art_key, art_size): build_small_art(pil_art, art_size, radius),
+        }
+
+    def _apply_media_state(self, state, playing, remember):
+        self.is_playing, self._media_state = playing, state
+        if remember and not any(t["title"] == state["title"] for t in self._song_history):
+            self._song_history.insert(0, state)
+            if len(self._song_history) > 10: self._song_history.pop()
+
+    def _apply_progress(self, updates, playing):
+        # Merged into a new dict so the media loop never sees a half-updated state
+        self.is_playing = playing
+        if self._media_state:
+            self._media_state = {**self._media_state, **updates}
+            self._animate_progress_bar()
 
     def _bind_events(self):
         self.canvas.bind("<ButtonPress-1>", self._start_move_or_resize)
@@ -437,13 +725,20 @@ class UniversalMediaWidget:
     def _on_mouse_enter(self, e):
         if not self.mouse_is_over: 
             self.mouse_is_over = True
-            self._queue_command("refresh")
+            self._apply_hover_state()
         
     def _on_mouse_leave(self, e):
         self.canvas.config(cursor="")
         if self.mouse_is_over: 
             self.mouse_is_over = False
-            self._queue_command("refresh")
+            self._apply_hover_state()
+
+    def _apply_hover_state(self):
+        """Hover controls are always built (hidden when idle), so entering/leaving only flips their state."""
+        self.canvas.itemconfigure("hover_ui", state="normal" if self.mouse_is_over else "hidden")
+        if self.mouse_is_over:
+            self.canvas.itemconfigure("play_icon" if self._controls_playing else "pause_icon", state="hidden")
+        self._animate_progress_bar()
 
     def _start_move_or_resize(self, e):
         if self.canvas.find_withtag("current && (close || lock || pin || app_badge || prev_hitbox || play_hitbox || next_hitbox || vol_up || vol_down || progress_hitbox)"): return
@@ -467,7 +762,13 @@ class UniversalMediaWidget:
             new_h = self._start_size[1] + dy if self._resize_mode in ["height", "both"] else self._start_size[1]
             self._resize_widget(new_w, new_h)
         elif not self._is_resizing and not self.drag_locked:
-            self.root.geometry(f"+{self.root.winfo_x()+e.x-self._x}+{self.root.winfo_y()+e.y-self._y}")
+            # Motion events outpace window moves; keep the latest target and move once when Tk goes idle
+            self._pending_move = (self.root.winfo_x()+e.x-self._x, self.root.winfo_y()+e.y-self._y)
+            if self._move_idle_id is None: self._move_idle_id = self.root.after_idle(self._flush_move)
+
+    def _flush_move(self):
+        self._move_idle_id = None
+        self.root.geometry("+{}+{}".format(*self._pending_move))
 
     def _end_move_or_resize(self, e):
         self._is_resizing = False
@@ -475,18 +776,25 @@ class UniversalMediaWidget:
 
     def _ctrl_mousewheel_resize(self, e):
         d = e.delta // 120 if hasattr(e, 'delta') else (1 if e.num == 4 else -1)
-        self._resize_widget(self.root.winfo_width() + 20*d, self.root.winfo_height() + 20*d)
+        self._resize_widget(self.widget_width + 20*d, self.widget_height + 20*d)
 
     def _resize_widget(self, w, h):
         new_w, new_h = max(MIN_WIDGET_SIZE, min(MAX_WIDGET_SIZE, int(w))), max(MIN_WIDGET_SIZE, min(MAX_WIDGET_SIZE, int(h)))
         if new_w != self.widget_width or new_h != self.widget_height:
             self.widget_width, self.widget_height = new_w, new_h
-            self.root.geometry(f"{new_w}x{new_h}")
-            self._queue_command("refresh")
+            # Motion and wheel events arrive far faster than we can redraw; apply the latest size once per frame
+            if self._pending_resize_id is None: self._pending_resize_id = self.root.after(16, self._flush_resize)
             self._schedule_task("save_geometry", 2000, self._save_geometry)
 
+    def _flush_resize(self):
+        self._pending_resize_id = None
+        self.root.geometry(f"{self.widget_width}x{self.widget_height}")
+        self.root.update_idletasks()
+        self.update_ui_with_state()
+
     def _focus_or_launch_app(self, app_name):
-        if not app_name: return
+        # The worker pool is shut down as soon as closing starts, while the window is still fading out
+        if not app_name or self._stop_event.is_set(): return
         app_name = app_name.lower()
         
         def task():
@@ -500,18 +808,12 @@ class UniversalMediaWidget:
                 elif "vlc" in app_name: keywords = ["VLC media player"]
                 elif "firefox" in app_name: keywords = ["Mozilla Firefox"]
                 
-                EnumWindows = ctypes.windll.user32.EnumWindows
-                EnumWindowsProc = ctypes.WINFUNCTYPE(ctypes.c_bool, ctypes.POINTER(ctypes.c_int), ctypes.POINTER(ctypes.c_int))
-                GetWindowText = ctypes.windll.user32.GetWindowTextW
-                GetWindowTextLength = ctypes.windll.user32.GetWindowTextLengthW
-                IsWindowVisible = ctypes.windll.user32.IsWindowVisible
-                
                 def foreach_window(hwnd, lParam):
                     nonlocal found_window
-                    if IsWindowVisible(hwnd):
-                        length = GetWindowTextLength(hwnd)
+                    if USER32.IsWindowVisible(hwnd):
+                        length = USER32.GetWindowTextLengthW(hwnd)
                         buff = ctypes.create_unicode_buffer(length + 1)
-                        GetWindowText(hwnd, buff, length + 1)
+                        USER32.GetWindowTextW(hwnd, buff, length + 1)
                         title = buff.value.lower()
                         
                         if "melo box" in title or "widget" in title or ".py" in title:
@@ -519,13 +821,13 @@ class UniversalMediaWidget:
                             
                         for k in keywords:
                             if k.lower() in title:
-                                ctypes.windll.user32.ShowWindow(hwnd, 9) 
-                                ctypes.windll.user32.SetForegroundWindow(hwnd)
+                                USER32.ShowWindow(hwnd, 9) 
+                                USER32.SetForegroundWindow(hwnd)
                                 found_window = True
                                 return False 
                     return True
                 
-                EnumWindows(EnumWindowsProc(foreach_window), 0)
+                USER32.EnumWindows(WNDENUMPROC(foreach_window), 0)
             
             if not found_window:
                 cmd_map = {
@@ -539,17 +841,10 @@ class UniversalMediaWidget:
                 cmd = cmd_map.get(app_name, "")
                 if cmd: os.system(cmd)
                 
-        threading.Thread(target=task, daemon=True).start()
+        self._ctrl_pool.submit(task)
 
-    def _show_context_menu(self, e):
+    def _build_context_menu(self) -> tk.Menu:
         cm = tk.Menu(self.root, tearoff=0)
-        
-        with self._state_lock: app_name = self._media_state.get("app", "")
-        
-        if app_name:
-            cm.add_command(label=f"↗ Bring {app_name} to Front", command=lambda: self._focus_or_launch_app(app_name), font=(FONT_NAME, 9, "bold"))
-            cm.add_separator()
-            
         launch_menu = tk.Menu(cm, tearoff=0)
         self.menu_icons.clear()
         
@@ -570,10 +865,28 @@ class UniversalMediaWidget:
         opacity_menu = tk.Menu(cm, tearoff=0)
         for val in [1.0, 0.85, 0.7]: opacity_menu.add_command(label=f"{int(val*100)}%", command=lambda v=val: self._set_opacity(v))
         cm.add_cascade(label="Set Opacity", menu=opacity_menu)
-        cm.add_command(label=f"{'Unlock'if self.drag_locked else'Lock'} Position", command=self._toggle_drag_lock)
-        cm.add_command(label=f"{'Unpin'if self.is_pinned else'Pin'} Window", command=self._toggle_pin)
+        cm.add_command(label="Lock Position", command=self._toggle_drag_lock)
+        cm.add_command(label="Pin Window", command=self._toggle_pin)
         cm.add_separator()
         cm.add_command(label="Exit", command=self._on_close)
+        return cm
+
+    def _show_context_menu(self, e):
+        # Built once (icons included); each right-click only refreshes the entries that depend on state
+        if self._context_menu is None: self._context_menu = self._build_context_menu()
+        cm = self._context_menu
+        
+        app_name = self._media_state.get("app", "")
+        
+        if app_name != self._context_menu_app:
+            if self._context_menu_app: cm.delete(0, 1)
+            if app_name:
+                cm.insert_command(0, label=f"↗ Bring {app_name} to Front", command=lambda: self._focus_or_launch_app(app_name), font=(FONT_NAME, 9, "bold"))
+                cm.insert_separator(1)
+            self._context_menu_app = app_name
+            
+        cm.entryconfigure("*Position", label=f"{'Unlock'if self.drag_locked else'Lock'} Position")
+        cm.entryconfigure("*Window", label=f"{'Unpin'if self.is_pinned else'Pin'} Window")
         cm.post(e.x_root, e.y_root)
 
     def _set_opacity(self, value):
@@ -600,8 +913,18 @@ class UniversalMediaWidget:
             except Exception: pass
 
     def _on_close(self):
+        # Apply a resize or drag still waiting to be coalesced, so the saved geometry includes it
+        if self._pending_resize_id is not None:
+            self.root.after_cancel(self._pending_resize_id)
+            self._flush_resize()
+        if self._move_idle_id is not None:
+            self.root.after_cancel(self._move_idle_id)
+            self._flush_move()
+            self.root.update_idletasks()
         self._save_geometry()
         self._stop_event.set()
+        self._async_loop.call_soon_threadsafe(self._async_loop.stop)
+        self._ctrl_pool.shutdown(wait=False)
         self._fade_out()
 
     def _fade_out(self):
@@ -613,7 +936,7 @@ class UniversalMediaWidget:
             self.root.destroy()
 
     def _show_session_menu(self, e):
-        with self._state_lock: sessions = list(self._available_sessions)
+        sessions = self._available_sessions
         if not sessions: return
         
         dropdown = tk.Toplevel(self.root)
@@ -670,21 +993,39 @@ class UniversalMediaWidget:
     def _force_session_and_pause_others(self, target_app_id):
         self._forced_app_id = target_app_id
         self._send_media_command("pause_others_and_switch", target_app_id)
-        with self._state_lock: self.is_playing = False
+        self.is_playing = False
         self._queue_command("refresh")
 
     def update_ui_with_state(self):
         try:
-            self.widget_width, self.widget_height = self.root.winfo_width(), self.root.winfo_height()
-            with self._state_lock: s, p = self._media_state.copy(), self.is_playing
-            self.canvas.delete("all")
-            
-            self._draw_rounded_rect(0, 0, self.widget_width, self.widget_height, CORNER_RADIUS, "black", alpha=1.0)
-            self._draw_rounded_outline(0, 0, self.widget_width, self.widget_height, CORNER_RADIUS, "white", 2, alpha=0.4)
+            # While a resize is pending the window still has the old size; keep the requested one
+            if self._pending_resize_id is None: self.widget_width, self.widget_height = self.root.winfo_width(), self.root.winfo_height()
+            # State dicts are replaced, never mutated, so holding the reference is already a consistent snapshot
+            s, p = self._media_state, self.is_playing
+            # Frame, overlay and controls only depend on size and toggles; keep them and rebuild just the track content
+            chrome_key = (self.widget_width, self.widget_height, self.is_pinned, self.drag_locked)
+            chrome_rebuilt = chrome_key != self._chrome_key
+            if chrome_rebuilt:
+                # Chrome items are created on the first layout and moved into place on later ones
+                if self._chrome_key is None:
+                    self.canvas.delete("all")
+                    self._chrome_items = {}
+                self._draw_chrome()
+                self._chrome_key = chrome_key
+            prev, self._drawn_inputs = self._drawn_inputs, (drawn_track_key(s), p) + chrome_key
             
             pil_art = s.get("image") if s.get("image") and not DISABLE_IMAGES else None
             
+            # Same track on the same chrome: only position or the playing flag can differ, which touch just
+            # the progress bar and the play/pause glyph and EQ bars (unless pausing could switch to the slideshow)
+            if not chrome_rebuilt and prev and prev[0] == self._drawn_inputs[0] and (pil_art or not self._song_history):
+                self._set_playing_indicators(p)
+                return
+            
+            self.canvas.delete("backdrop", "content")
+            
             if not p and not pil_art and self._song_history:
+                self._show_progress_bar(False)
                 self._run_slideshow()
                 return
 
@@ -692,18 +1033,16 @@ class UniversalMediaWidget:
                 self.root.after_cancel(self._after_ids["slideshow"])
                 del self._after_ids["slideshow"]
 
-            if pil_art:
-                bg_art = crop_center_fill(pil_art.copy(), self.widget_width, self.widget_height)
-                bg_art = bg_art.filter(ImageFilter.GaussianBlur(6))
-                alpha_layer = Image.new("L", bg_art.size, int(255 * 0.65))
-                bg_art.putalpha(alpha_layer)
-                tk_bg_art = ImageTk.PhotoImage(create_rounded_image(bg_art, (self.widget_width, self.widget_height), CORNER_RADIUS))
-                self.canvas.create_image(0, 0, anchor="nw", image=tk_bg_art)
-                self.tk_image_references["bg_art"] = tk_bg_art
+            if pil_art: self._draw_bg_art(pil_art, s.get("art_key"))
                 
             self._create_ui_elements(s, p, pil_art)
-            self._draw_progress_bar_base()
-        except Exception as e: logging.error(f"UI update error:{e}")
+            # The bar items persist with the chrome; lift them back over the freshly drawn content
+            self.canvas.tag_raise("progress")
+            self._show_progress_bar(True)
+            self._animate_progress_bar()
+        except Exception as e:
+            self._drawn_inputs = None
+            logging.error(f"UI update error:{e}")
 
     def _run_slideshow(self):
         if not self._song_history: return
@@ -711,34 +1050,64 @@ class UniversalMediaWidget:
         hist_track = self._song_history[self._slideshow_idx]
         
         pil_art = hist_track.get("image")
-        if pil_art:
-            bg_art = crop_center_fill(pil_art.copy(), self.widget_width, self.widget_height)
-            bg_art = bg_art.filter(ImageFilter.GaussianBlur(6))
-            alpha_layer = Image.new("L", bg_art.size, int(255 * 0.65))
-            bg_art.putalpha(alpha_layer)
-            tk_bg_art = ImageTk.PhotoImage(create_rounded_image(bg_art, (self.widget_width, self.widget_height), CORNER_RADIUS))
-            self.canvas.create_image(0, 0, anchor="nw", image=tk_bg_art, tags="slideshow")
-            self.tk_image_references["bg_art"] = tk_bg_art
+        if pil_art: self._draw_bg_art(pil_art, hist_track.get("art_key"), tags=("backdrop", "slideshow"))
             
         self._create_ui_elements(hist_track, False, pil_art)
         self._schedule_task("slideshow", 8000, self.update_ui_with_state)
 
+    def _draw_bg_art(self, pil_art, art_key, tags="backdrop"):
+        # The blurred backdrop is the most expensive thing on the canvas, so reuse it per (art, size)
+        size = (self.widget_width, self.widget_height)
+        cache_key = ("bg", art_key, size)
+        tk_bg_art = self._art_photo_cache.get(cache_key) if art_key else None
+        if tk_bg_art is None:
+            tk_bg_art = ImageTk.PhotoImage(build_bg_art(pil_art, size))
+            if art_key: self._art_photo_cache[cache_key] = tk_bg_art
+        self.canvas.create_image(0, 0, anchor="nw", image=tk_bg_art, tags=tags)
+        self.canvas.tag_raise("backdrop", "outline")
+        self.tk_image_references["bg_art"] = tk_bg_art
+
+    def _draw_chrome(self):
+        """Items that survive track updates: frame, hover overlay, controls and the resize grip."""
+        self._draw_widget_frame(self.widget_width, self.widget_height)
+        self._draw_rounded_rect(0, 0, self.widget_width, self.widget_height, CORNER_RADIUS, "black", alpha=OVERLAY_ALPHA, tags=("hover_ui", "hover_overlay"), key="overlay")
+        self._draw_control_icons()
+        self._draw_resize_grip()
+        self._draw_top_right_icons()
+        self._draw_volume_controls()
+        self._draw_progress_bar_base()
+
+    def _layout_for(self, w, h) -> Dict[str, Any]:
+        """Size-derived geometry and font tuples, computed once per widget size."""
+        key = (w, h)
+        layout = self._layout_cache.get(key)
+        if layout is None:
+            art_size, art_radius = small_art_geometry(w, h)
+            art_margin = 16
+            badge_fs = max(10, int(w / 22))
+            fs_s, fs_a = max(11, int(w / 18)), max(9, int(w / 22))
+            layout = {
+                "art_size": art_size, "art_margin": art_margin, "art_y": h - art_margin - art_size - 22,
+                "art_radius": art_radius, "text_x_art": art_margin + art_size + 14,
+                "badge_font": (FONT_NAME, badge_fs, "bold"), "badge_icon_size": max(18, badge_fs + 6),
+                "fs_s": fs_s, "song_font": (FONT_NAME, fs_s, "bold"), "artist_font": (FONT_NAME, fs_a, "normal"),
+                "time_font": (FONT_NAME, max(8, int(w / 26))),
+            }
+            self._layout_cache[key] = layout
+        return layout
+
     def _create_ui_elements(self, s, p, pil_art):
-        if self.mouse_is_over:
-            self._draw_rounded_rect(0, 0, self.widget_width, self.widget_height, CORNER_RADIUS, "black", alpha=OVERLAY_ALPHA, tags="hover_overlay")
-        
-        art_size = int(min(self.widget_width, self.widget_height) * 0.28)
-        art_margin = 16
-        art_y = self.widget_height - art_margin - art_size - 22
+        layout = self._layout_for(self.widget_width, self.widget_height)
+        art_size, art_margin, art_y = layout["art_size"], layout["art_margin"], layout["art_y"]
         
         app_name = s.get("app", "")
         app_domain = s.get("app_domain", "")
         
         if app_name:
-            font_sz = max(10, int(self.widget_width / 22))
-            icon_size = max(18, font_sz + 6)
+            badge_font = layout["badge_font"]
+            icon_size = layout["badge_icon_size"]
             pad = 6
-            badge_tags = ("app_badge",)
+            badge_tags = ("app_badge", "content")
             
             current_x = 12
             
@@ -753,53 +1122,64 @@ class UniversalMediaWidget:
             display_text = f"{app_name}  ▼" 
             text_y = 12 + (icon_size / 2)
             
-            self.canvas.create_text(current_x+1, text_y+1, text=display_text, fill="black", font=(FONT_NAME, font_sz, "bold"), anchor="w", tags=badge_tags)
-            self.canvas.create_text(current_x, text_y, text=display_text, fill="white", font=(FONT_NAME, font_sz, "bold"), anchor="w", tags=badge_tags)
+            self.canvas.create_text(current_x+1, text_y+1, text=display_text, fill="black", font=badge_font, anchor="w", tags=badge_tags)
+            self.canvas.create_text(current_x, text_y, text=display_text, fill="white", font=badge_font, anchor="w", tags=badge_tags)
             
             self.canvas.tag_bind("app_badge", "<Button-1>", self._show_session_menu)
             self.canvas.tag_bind("app_badge", "<Enter>", lambda e: self.canvas.config(cursor="hand2"))
             self.canvas.tag_bind("app_badge", "<Leave>", lambda e: self.canvas.config(cursor=""))
 
         if pil_art:
-            cropped_art = crop_center_fill(pil_art.copy(), art_size, art_size)
-            tk_art = ImageTk.PhotoImage(create_rounded_image(cropped_art, (art_size, art_size), int(art_size * 0.15)))
-            self.canvas.create_image(art_margin, art_y, anchor="nw", image=tk_art)
+            art_key = s.get("art_key")
+            cache_key = ("small", art_key, art_size)
+            tk_art = self._art_photo_cache.get(cache_key) if art_key else None
+            if tk_art is None:
+                tk_art = ImageTk.PhotoImage(build_small_art(pil_art, art_size, layout["art_radius"]))
+                if art_key: self._art_photo_cache[cache_key] = tk_art
+            self.canvas.create_image(art_margin, art_y, anchor="nw", image=tk_art, tags="content")
             self.tk_image_references["small_album_art"] = tk_art
             
         song = s.get("title", "Nothing Playing")
         artist = s.get("artist", "Play media to start")
         
-        fs_s = max(11, int(self.widget_width / 18))
-        fs_a = max(9, int(self.widget_width / 22))
+        song_font, artist_font = layout["song_font"], layout["artist_font"]
         
-        text_x = art_margin + art_size + 14 if pil_art else art_margin
+        text_x = layout["text_x_art"] if pil_art else art_margin
         text_y = art_y
         max_text_w = self.widget_width - text_x - 12
         
-        song_trunc = truncate_text(song, (FONT_NAME, fs_s, "bold"), max_text_w)
-        artist_trunc = truncate_text(artist, (FONT_NAME, fs_a, "normal"), max_text_w)
+        song_trunc = truncate_text(song, song_font, max_text_w)
+        artist_trunc = truncate_text(artist, artist_font, max_text_w)
         
-        song_id = self.canvas.create_text(text_x, text_y, text=song_trunc, fill="white", font=(FONT_NAME,fs_s,"bold"), anchor="nw")
+        song_id = self.canvas.create_text(text_x, text_y, text=song_trunc, fill="white", font=song_font, anchor="nw", tags="content")
         bbox = self.canvas.bbox(song_id)
-        artist_y = bbox[3] + 4 if bbox else text_y + fs_s + 4
+        artist_y = bbox[3] + 4 if bbox else text_y + layout["fs_s"] + 4
             
-        self.canvas.create_text(text_x, artist_y, text=artist_trunc, fill="lightgray", font=(FONT_NAME,fs_a), anchor="nw")
+        self.canvas.create_text(text_x, artist_y, text=artist_trunc, fill="lightgray", font=artist_font, anchor="nw", tags="content")
         
-        if p: self._draw_eq_bars(text_x + font.Font(family=FONT_NAME, size=fs_a).measure(artist_trunc) + 10, artist_y)
+        self._eq_pos = (text_x + get_font(artist_font).measure(artist_trunc) + 10, artist_y)
+        if p: self._draw_eq_bars(*self._eq_pos)
         
-        if self.mouse_is_over:
-            self._draw_control_icons(p)
-            self._draw_resize_grip()
-            self._draw_top_right_icons()
-            self._draw_volume_controls()
+        # Content sits between the hover overlay and the persistent controls
+        self.canvas.tag_raise("content", "hover_overlay")
+        self._controls_playing = p
+        self._apply_hover_state()
+
+    def _set_playing_indicators(self, p):
+        self.canvas.delete("eq_bars")
+        if p and self._eq_pos:
+            self._draw_eq_bars(*self._eq_pos)
+            self.canvas.tag_raise("eq_bars", "hover_overlay")
+        self._controls_playing = p
+        self._apply_hover_state()
 
     def _draw_eq_bars(self, x, y):
         for i in range(3):
             bar_id = f"eq_bar_{i}"
-            self.canvas.create_rectangle(x + (i*4), y + 4, x + (i*4) + 2, y + 14, fill="#1DB954", outline="", tags=("eq_bars", bar_id))
+            self.canvas.create_rectangle(x + (i*4), y + 4, x + (i*4) + 2, y + 14, fill="#1DB954", outline="", tags=("eq_bars", bar_id, "content"))
 
     def _animate_eq_bars(self):
-        with self._state_lock: p = self.is_playing
+        p = self.is_playing
         if p:
             for i in range(3):
                 h = random.randint(2, 10)
@@ -814,27 +1194,30 @@ class UniversalMediaWidget:
                     x1, _, x2, y2 = coords
                     self.canvas.coords(f"eq_bar_{i}", x1, y2 - 2, x2, y2)
 
+    def _place(self, key, kind, *coords, **opts):
+        """Creates the chrome item named key on first layout; later layouts move and restyle the same item."""
+        item = self._chrome_items.get(key)
+        if item is None:
+            item = self._chrome_items[key] = getattr(self.canvas, f"create_{kind}")(*coords, **opts)
+        else:
+            self.canvas.coords(item, *coords)
+            self.canvas.itemconfigure(item, **opts)
+        return item
+
     def _draw_top_right_icons(self):
-        s, m, pad = max(12, min(self.widget_width, self.widget_height)//18), 12, 3
+        s, m = max(12, min(self.widget_width, self.widget_height)//18), 12
         
+        # Disc and glyph of each button are one sprite, so a button is a single item that is also its hitbox
         cx, y = self.widget_width - m - s, m
-        self.canvas.create_oval(cx, y, cx+s, y+s, fill="#ff4444", outline="", tags=("tr_icon","close"))
-        self.canvas.create_line(cx+pad, y+pad, cx+s-pad, y+s-pad, fill="white", width=2, tags=("tr_icon","close"))
-        self.canvas.create_line(cx+s-pad, y+pad, cx+pad, y+s-pad, fill="white", width=2, tags=("tr_icon","close"))
+        self._place_icon("close", cx, y, s, "#ff4444", ("hover_ui","tr_icon","close"))
         self.canvas.tag_bind("close","<Button-1>", lambda e: self._on_close())
 
         px = cx - s - 6
-        pin_color = "#1DB954" if self.is_pinned else "#666666"
-        self.canvas.create_oval(px, y, px+s, y+s, fill=pin_color, outline="", tags=("tr_icon","pin"))
-        self.canvas.create_oval(px+(s*0.3), y+(s*0.2), px+(s*0.7), y+(s*0.6), fill="white", outline="", tags=("tr_icon","pin"))
-        self.canvas.create_line(px+(s*0.5), y+(s*0.6), px+(s*0.5), y+s-2, fill="white", width=2, tags=("tr_icon","pin"))
+        self._place_icon("pin", px, y, s, "#1DB954" if self.is_pinned else "#666666", ("hover_ui","tr_icon","pin"))
         self.canvas.tag_bind("pin","<Button-1>", lambda e: self._toggle_pin())
 
         lx = px - s - 6
-        lock_color = "#ff8800" if self.drag_locked else "#666666"
-        self.canvas.create_oval(lx, y, lx+s, y+s, fill=lock_color, outline="", tags=("tr_icon","lock"))
-        self.canvas.create_rectangle(lx+(s*0.25), y+(s*0.45), lx+(s*0.75), y+(s*0.8), fill="white", outline="", tags=("tr_icon","lock"))
-        self.canvas.create_arc(lx+(s*0.35), y+(s*0.2), lx+(s*0.65), y+(s*0.6), start=0, extent=180, outline="white", width=1.5, style=tk.ARC, tags=("tr_icon","lock"))
+        self._place_icon("lock", lx, y, s, "#ff8800" if self.drag_locked else "#666666", ("hover_ui","tr_icon","lock"))
         self.canvas.tag_bind("lock","<Button-1>", lambda e: self._toggle_drag_lock())
 
     def _draw_volume_controls(self):
@@ -842,174 +1225,263 @@ class UniversalMediaWidget:
         x = self.widget_width - s - 12
         cy = self.widget_height / 2
         
-        uy = cy - s - 5
-        self.canvas.create_oval(x, uy, x+s, uy+s, fill="#404040", outline="", tags="vol_up")
-        self.canvas.create_line(x+s/2, uy+s*0.25, x+s/2, uy+s*0.75, fill="white", width=2, tags="vol_up")
-        self.canvas.create_line(x+s*0.25, uy+s/2, x+s*0.75, uy+s/2, fill="white", width=2, tags="vol_up")
+        self._place_icon("vol_up", x, cy - s - 5, s, "#404040", ("hover_ui","vol_up"))
         self.canvas.tag_bind("vol_up", "<Button-1>", lambda e: self._send_vol_command(VK_VOLUME_UP))
         
-        dy = cy + 5
-        self.canvas.create_oval(x, dy, x+s, dy+s, fill="#404040", outline="", tags="vol_down")
-        self.canvas.create_line(x+s*0.25, dy+s/2, x+s*0.75, dy+s/2, fill="white", width=2, tags="vol_down")
+        self._place_icon("vol_down", x, cy + 5, s, "#404040", ("hover_ui","vol_down"))
         self.canvas.tag_bind("vol_down", "<Button-1>", lambda e: self._send_vol_command(VK_VOLUME_DOWN))
 
+    def _place_icon(self, name, x, y, s, color, tags):
+        sprite = self._icon_sprite(name, s, color)
+        self._place(f"icon_{name}", "image", x, y, anchor="nw", image=sprite, tags=tags)
+        self.tk_image_references[f"icon_{name}"] = sprite
+
+    def _icon_sprite(self, name, s, color) -> ImageTk.PhotoImage:
+        """A round chrome button (coloured disc plus white glyph) as one image, cached per size and colour."""
+        key = (name, s, color)
+        if (img_ref := self._icon_sprites.get(key)) is None:
+            # One pixel of slack so the disc spans x..x+s inclusive, as the canvas oval did
+            img = Image.new("RGBA", (s + 1, s + 1), (0, 0, 0, 0))
+            d, c, pad = ImageDraw.Draw(img), "white", 3
+            d.ellipse((0, 0, s, s), fill=color)
+            if name == "close":
+                d.line((pad, pad, s-pad, s-pad), fill=c, width=2)
+                d.line((s-pad, pad, pad, s-pad), fill=c, width=2)
+            elif name == "pin":
+                d.ellipse((s*0.3, s*0.2, s*0.7, s*0.6), fill=c)
+                d.line((s*0.5, s*0.6, s*0.5, s-2), fill=c, width=2)
+            elif name == "lock":
+                d.rectangle((s*0.25, s*0.45, s*0.75, s*0.8), fill=c)
+                d.arc((s*0.35, s*0.2, s*0.65, s*0.6), 180, 360, fill=c, width=2)
+            else:
+                d.line((s*0.25, s/2, s*0.75, s/2), fill=c, width=2)
+                if name == "vol_up": d.line((s/2, s*0.25, s/2, s*0.75), fill=c, width=2)
+            img_ref = ImageTk.PhotoImage(img)
+            self._icon_sprites[key] = img_ref
+        return img_ref
+
     def _draw_resize_grip(self):
         s = 12; x, y = self.widget_width - s - 4, self.widget_height - s - 14
-        for i in range(3): self.canvas.create_line(x+i*3, y+s-2, x+s-2, y+i*3, fill="white", width=1, tags="resize_grip")
-
-    def _draw_rounded_rect(self, x1, y1, x2, y2, r, fill, alpha=1.0, tags=""):
+        # The grip never changes size, so its three diagonals are one sprite rendered once
+        if (img_ref := self._grip_photo) is None:
+            img = Image.new("RGBA", (s, s), (0, 0, 0, 0))
+            d = ImageDraw.Draw(img)
+            for i in range(3): d.line((i*3, s-2, s-2, i*3), fill="white", width=1)
+            img_ref = self._grip_photo = ImageTk.PhotoImage(img)
+        self._place("grip", "image", x, y, anchor="nw", image=img_ref, tags=("hover_ui","resize_grip"))
+
+    def _rounded_mask(self, w, h, r, alpha=1.0, width=0) -> Image.Image:
+        """Returns the "L" mask for a filled (width=0) or outlined rounded rect, scaled by alpha."""
+        mask = rounded_mask((w, h), r, width)
+        a = int(alpha*255)
+        # A literal lookup table runs entirely in C; a lambda would be called once per level
+        return mask if a >= 255 else mask.point([0] + [a] * 255)
+
+    def _rgb(self, color) -> Tuple[int, int, int]:
+        # The palette is a handful of fixed colours; parse each through Tk only once.
+        # winfo_rgb reports 16-bit channels (0xRRRR), so the high byte is the 8-bit value PIL expects
+        if (rgb := self._rgb_cache.get(color)) is None:
+            rgb = self._rgb_cache[color] = tuple(v >> 8 for v in self.root.winfo_rgb(color))
+        return rgb
+
+    def _draw_rounded_rect(self, x1, y1, x2, y2, r, fill, alpha=1.0, tags="", key=None):
         w, h = int(x2-x1), int(y2-y1)
         if w <= 0 or h <=0 or alpha <= 0.01: return
-        key = f"rect_{fill}_{alpha:.2f}_{w}x{h}_{r}"
-        if not(img_ref := self._overlay_cache.get(key)):
-            img = Image.new("RGBA", (w, h), (0,0,0,0))
-            ImageDraw.Draw(img).rounded_rectangle((0,0,w,h), r, fill=self.root.winfo_rgb(fill)+(int(alpha*255),))
+        cache_key = f"rect_{fill}_{alpha:.2f}_{w}x{h}_{r}"
+        if not(img_ref := self._overlay_cache.get(cache_key)):
+            img = Image.new("RGBA", (w, h), self._rgb(fill)+(0,))
+            img.putalpha(self._rounded_mask(w, h, r, alpha))
             img_ref = ImageTk.PhotoImage(img)
-            self._overlay_cache[key] = img_ref
-        self.canvas.create_image(x1, y1, anchor="nw", image=img_ref, tags=tags)
-        self.tk_image_references[key] = img_ref
-
-    def _draw_rounded_outline(self, x1, y1, x2, y2, r, fill, width, alpha=1.0):
-        w, h = int(x2-x1), int(y2-y1)
-        if w <= 0 or h <= 0 or alpha <= 0.01: return
-        key = f"out_{fill}_{alpha:.2f}_{w}x{h}_{r}_{width}"
+            self._overlay_cache[cache_key] = img_ref
+        if key: self._place(key, "image", x1, y1, anchor="nw", image=img_ref, tags=tags)
+        else: self.canvas.create_image(x1, y1, anchor="nw", image=img_ref, tags=tags)
+        # One reference slot per placed item, so resizing doesn't pin every past size's image past the LRU
+        self.tk_image_references[key or cache_key] = img_ref
+
+    def _draw_widget_frame(self, w, h):
+        """Opaque rounded background and its faint white outline, composited into one image per size."""
+        if w <= 0 or h <= 0: return
+        key = f"frame_{w}x{h}_{CORNER_RADIUS}"
         if not(img_ref := self._overlay_cache.get(key)):
-            img = Image.new("RGBA", (w, h), (0,0,0,0))
-            ImageDraw.Draw(img).rounded_rectangle((0,0,w,h), r, outline=self.root.winfo_rgb(fill)+(int(alpha*255),), width=width)
+            img = Image.new("RGBA", (w, h), self._rgb("black")+(0,))
+            img.putalpha(self._rounded_mask(w, h, CORNER_RADIUS))
+            outline = Image.new("RGBA", (w, h), self._rgb("white")+(0,))
+            outline.putalpha(self._rounded_mask(w, h, CORNER_RADIUS, 0.4, 2))
+            img.alpha_composite(outline)
             img_ref = ImageTk.PhotoImage(img)
             self._overlay_cache[key] = img_ref
-        self.canvas.create_image(x1, y1, anchor="nw", image=img_ref, tags="outline")
-        self.tk_image_references[key] = img_ref
+        self._place("frame", "image", 0, 0, anchor="nw", image=img_ref, tags="outline")
+        self.tk_image_references["frame"] = img_ref
+
+    def _control_sprite(self, name, bw, bh, s) -> ImageTk.PhotoImage:
+        """One control glyph centred in a transparent hitbox-sized image, cached per widget size."""
+        key = (name, bw, bh, round(s, 1))
+        if (img_ref := self._ctrl_sprites.get(key)) is None:
+            img = Image.new("RGBA", (bw, bh), (0, 0, 0, 0))
+            d, x, y, c = ImageDraw.Draw(img), bw / 2, bh / 2, "white"
+            if name == "prev":
+                d.polygon([(x + s*0.2, y - s/2), (x + s*0.2, y + s/2), (x - s*0.3, y)], fill=c)
+                d.rectangle((x - s*0.5, y - s/2, x - s*0.3, y + s/2), fill=c)
+            elif name == "next":
+                d.polygon([(x - s*0.2, y - s/2), (x - s*0.2, y + s/2), (x + s*0.3, y)], fill=c)
+                d.rectangle((x + s*0.3, y - s/2, x + s*0.5, y + s/2), fill=c)
+            elif name == "pause":
+                pw, g = s*0.7, s*0.3
+                d.rectangle((x - pw/2, y - s/2, x - g/2, y + s/2), fill=c)
+                d.rectangle((x + g/2, y - s/2, x + pw/2, y + s/2), fill=c)
+            else:
+                d.polygon([(x - s/2.5, y - s/2), (x - s/2.5, y + s/2), (x + s/2, y)], fill=c)
+            img_ref = ImageTk.PhotoImage(img)
+            self._ctrl_sprites[key] = img_ref
+        return img_ref
 
-    def _draw_control_icons(self, p):
+    def _draw_control_icons(self):
         s = min(self.widget_width, self.widget_height) / 10
         y = self.widget_height * 0.40
-        c = "white"
-        hitbox_w, hitbox_h = self.widget_width / 3.5, s * 3
+        bw, bh = max(1, int(self.widget_width / 3.5)), max(1, int(s * 3))
+        
+        # Each button is a single pre-rendered image that doubles as its hitbox.
+        # Both play and pause exist; _apply_hover_state hides whichever does not match the playback state
+        buttons = (
+            ("prev", self.widget_width * 0.25, ("hover_ui", "prev_hitbox")),
+            ("pause", self.widget_width / 2, ("hover_ui", "play_hitbox", "pause_icon")),
+            ("play", self.widget_width / 2, ("hover_ui", "play_hitbox", "play_icon")),
+            ("next", self.widget_width * 0.75, ("hover_ui", "next_hitbox")),
+        )
+        for name, x, tags in buttons:
+            sprite = self._control_sprite(name, bw, bh, s)
+            self._place(f"ctrl_{name}", "image", x, y, image=sprite, tags=tags)
+            self.tk_image_references[f"ctrl_{name}"] = sprite
         
-        prev_x = self.widget_width * 0.25
-        self.canvas.create_rectangle(prev_x - hitbox_w/2, y - hitbox_h/2, prev_x + hitbox_w/2, y + hitbox_h/2, fill="", outline="", tags="prev_hitbox")
-        self.canvas.create_polygon([(prev_x + s*0.2, y - s/2), (prev_x + s*0.2, y + s/2), (prev_x - s*0.3, y)], fill=c, tags="prev_hitbox")
-        self.canvas.create_rectangle(prev_x - s*0.5, y - s/2, prev_x - s*0.3, y+s/2, fill=c, outline="", tags="prev_hitbox")
         self.canvas.tag_bind("prev_hitbox", "<Button-1>", lambda e: self._send_media_command("prev"))
-
-        play_x = self.widget_width / 2
-        self.canvas.create_rectangle(play_x - hitbox_w/2, y - hitbox_h/2, play_x + hitbox_w/2, y + hitbox_h/2, fill="", outline="", tags="play_hitbox")
-        if p:
-            pw, g = s*0.7, s*0.3
-            self.canvas.create_rectangle(play_x-pw/2, y-s/2, play_x-g/2, y+s/2, fill=c, outline="", tags="play_hitbox")
-            self.canvas.create_rectangle(play_x+g/2, y-s/2, play_x+pw/2, y+s/2, fill=c, outline="", tags="play_hitbox")
-        else:
-            self.canvas.create_polygon([(play_x-s/2.5, y-s/2), (play_x-s/2.5, y+s/2), (play_x+s/2, y)], fill=c, tags="play_hitbox")
         self.canvas.tag_bind("play_hitbox", "<Button-1>", lambda e: self._send_media_command("play_pause"))
-
-        next_x = self.widget_width * 0.75
-        self.canvas.create_rectangle(next_x - hitbox_w/2, y - hitbox_h/2, next_x + hitbox_w/2, y + hitbox_h/2, fill="", outline="", tags="next_hitbox")
-        self.canvas.create_polygon([(next_x - s*0.2, y - s/2), (next_x - s*0.2, y + s/2), (next_x + s*0.3, y)], fill=c, tags="next_hitbox")
-        self.canvas.create_rectangle(next_x + s*0.5, y-s/2, next_x + s*0.3, y+s/2, fill=c, outline="", tags="next_hitbox")
         self.canvas.tag_bind("next_hitbox", "<Button-1>", lambda e: self._send_media_command("next"))
 
     def _draw_progress_bar_base(self):
-        self.canvas.delete("progress_bar_base", "progress_fg", "progress_ball", "progress_time", "progress_dur", "progress_hitbox")
-        
+        """Persistent progress items, laid out with the chrome; hidden until a track view shows them."""
         bar_height = 5
         margin = 24
         y_center = self.widget_height - 20
         bar_w = self.widget_width - (margin * 2)
         
-        self.canvas.create_line(margin, y_center, margin + bar_w, y_center, fill="#404040", width=bar_height, capstyle=tk.ROUND, tags="progress_bar_base")
-        self.canvas.create_line(margin, y_center, margin, y_center, fill="#1DB954", width=bar_height, capstyle=tk.ROUND, tags="progress_fg")
+        self._place("prog_base", "line", margin, y_center, margin + bar_w, y_center, fill="#404040", width=bar_height, capstyle=tk.ROUND, tags=("progress", "progress_bar_base"), state="hidden")
+        self._place("prog_fg", "line", margin, y_center, margin, y_center, fill="#1DB954", width=bar_height, capstyle=tk.ROUND, tags=("progress", "progress_fg"), state="hidden")
         
         ball_r = 6
-        self.canvas.create_oval(margin - ball_r, y_center - ball_r, margin + ball_r, y_center + ball_r, fill="white", outline="", tags="progress_ball", state="hidden")
+        self._place("prog_ball", "oval", margin - ball_r, y_center - ball_r, margin + ball_r, y_center + ball_r, fill="white", outline="", tags=("progress", "progress_ball"), state="hidden")
         
-        font_size = max(8, int(self.widget_width / 26))
+        time_font = self._layout_for(self.widget_width, self.widget_height)["time_font"]
         y_pos = y_center - 13
-        self.canvas.create_text(margin, y_pos, text="00:00", fill="lightgray", font=(FONT_NAME, font_size), anchor="w", tags="progress_time", state="hidden")
-        self.canvas.create_text(self.widget_width - margin, y_pos, text="00:00", fill="lightgray", font=(FONT_NAME, font_size), anchor="e", tags="progress_dur", state="hidden")
+        self._place("prog_time", "text", margin, y_pos, text="00:00", fill="lightgray", font=time_font, anchor="w", tags=("progress", "progress_time"), state="hidden")
+        self._place("prog_dur", "text", self.widget_width - margin, y_pos, text="00:00", fill="lightgray", font=time_font, anchor="e", tags=("progress", "progress_dur"), state="hidden")
+        self._progress_visible = self._progress_details_shown = False
+        self._progress_labels = self._progress_fg_x = self._progress_ball_x = None
 
         # Stop the hitbox 12 pixels above the bottom edge and 25 pixels from the right
         # This prevents it from overlapping the bottom resize border and the bottom-right corner grip
-        self.canvas.create_rectangle(0, self.widget_height - 35, self.widget_width - 25, self.widget_height - 12, fill="", outline="", tags="progress_hitbox")
+        self._place("prog_hitbox", "rectangle", 0, self.widget_height - 35, self.widget_width - 25, self.widget_height - 12, fill="", outline="", tags=("progress", "progress_hitbox"), state="hidden")
         self.canvas.tag_bind("progress_hitbox", "<Button-1>", self._seek_media)
         self.canvas.tag_bind("progress_hitbox", "<B1-Motion>", self._seek_media)
 
+    def _show_progress_bar(self, visible):
+        if visible == self._progress_visible: return
+        self.canvas.itemconfigure("progress_bar_base || progress_fg || progress_hitbox", state="normal" if visible else "hidden")
+        if not visible and self._progress_details_shown:
+            self.canvas.itemconfigure("progress_ball || progress_time || progress_dur", state="hidden")
+            self._progress_details_shown = False
+        self._progress_visible = visible
+
+    def _progress_tick(self):
+        self._animate_progress_bar()
+        # A paused bar only moves on seek, hover or a new position, and each of those repaints it directly
+        self._after_ids["progress_bar"] = self.root.after(PROGRESS_TICK_MS if self.is_playing else PROGRESS_PAUSED_MS, self._progress_tick)
+
     def _animate_progress_bar(self):
-        with self._state_lock: s, p = self._media_state.copy(), self.is_playing
-        if not s.get("duration_ms"): return
+        s, p = self._media_state, self.is_playing
+        if not s.get("duration_ms") or not self._progress_visible: return
         
-        elapsed = (time.time() - s.get("last_update_time", time.time())) * 1000 if p else 0
-        prog = min(s.get("progress_ms", 0) + elapsed, s["duration_ms"])
+        prog = min(interpolate_progress_ms(s, p, time.time()), s["duration_ms"])
         ratio = max(0.0, min(1.0, prog / s["duration_ms"]))
         
         margin = 24
         bar_w = self.widget_width - (margin * 2)
-        bw = max(0.1, bar_w * ratio)
+        # Snap to whole pixels: the bar only moves every few hundred ms, so most ticks need no canvas call
+        bw = max(0.1, round(bar_w * ratio))
         y_center = self.widget_height - 20
         
-        self.canvas.coords("progress_fg", margin, y_center, margin + bw, y_center)
+        if bw != self._progress_fg_x:
+            self.canvas.coords("progress_fg", margin, y_center, margin + bw, y_center)
+            self._progress_fg_x = bw
         
         if self.mouse_is_over:
             ball_r = 6
-            self.canvas.coords("progress_ball", margin + bw - ball_r, y_center - ball_r, margin + bw + ball_r, y_center + ball_r)
-            self.canvas.itemconfig("progress_time", text=format_ms(prog))
-            self.canvas.itemconfig("progress_dur", text=format_ms(s["duration_ms"]))
-            
-            self.canvas.itemconfig("progress_ball", state="normal")
-            self.canvas.itemconfig("progress_time", state="normal")
-            self.canvas.itemconfig("progress_dur", state="normal")
-        else:
-            self.canvas.itemconfig("progress_ball", state="hidden")
-            self.canvas.itemconfig("progress_time", state="hidden")
-            self.canvas.itemconfig("progress_dur", state="hidden")
+            if bw != self._progress_ball_x:
+                self.canvas.coords("progress_ball", margin + bw - ball_r, y_center - ball_r, margin + bw + ball_r, y_center + ball_r)
+                self._progress_ball_x = bw
+            labels = (format_ms(prog), format_ms(s["duration_ms"]))
+            if labels != self._progress_labels:
+                self.canvas.itemconfig("progress_time", text=labels[0])
+                self.canvas.itemconfig("progress_dur", text=labels[1])
+                self._progress_labels = labels
+        
+        # Only touch item visibility when the hover state actually flips
+        if self._progress_details_shown != self.mouse_is_over:
+            state = "normal" if self.mouse_is_over else "hidden"
+            self.canvas.itemconfig("progress_ball", state=state)
+            self.canvas.itemconfig("progress_time", state=state)
+            self.canvas.itemconfig("progress_dur", state=state)
+            self._progress_details_shown = self.mouse_is_over
 
     def _seek_media(self, event):
-        with self._state_lock:
-            if not self._media_state.get("duration_ms"): return
-            click_x = event.x
-            margin = 24
-            bar_w = self.widget_width - (margin * 2)
-            
-            ratio = max(0.0, min(1.0, (click_x - margin) / bar_w))
-            target_ms = ratio * self._media_state["duration_ms"]
-            self._media_state["progress_ms"] = target_ms
-            self._media_state["last_update_time"] = time.time()
+        if not self._media_state.get("duration_ms"): return
+        click_x = event.x
+        margin = 24
+        bar_w = self.widget_width - (margin * 2)
+        
+        ratio = max(0.0, min(1.0, (click_x - margin) / bar_w))
+        target_ms = ratio * self._media_state["duration_ms"]
+        self._media_state = {**self._media_state, "progress_ms": target_ms, "last_update_time": time.time()}
+        self._animate_progress_bar()
             
         self._send_media_command("seek", target_ms)
 
     def _send_vol_command(self, vk):
-        if not NATIVE_CONTROLS_AVAILABLE: return
-        try:
-            USER32.keybd_event(vk, 0, 0, 0)
-            time.sleep(0.02)
-            USER32.keybd_event(vk, 0, KEYEVENTF_KEYUP, 0)
-        except Exception: pass
+        if not NATIVE_CONTROLS_AVAILABLE or self._stop_event.is_set(): return
+        def press():
+            try:
+                USER32.keybd_event(vk, 0, 0, 0)
+                time.sleep(0.02)
+                USER32.keybd_event(vk, 0, KEYEVENTF_KEYUP, 0)
+            except Exception: pass
+        # The key-down/up gap would otherwise stall the Tk thread for every click
+        self._ctrl_pool.submit(press)
 
     def _send_media_command(self, action, payload=None):
+        # Clicks during the fade-out would be scheduled onto the already stopped media loop
+        if self._stop_event.is_set(): return
         self._last_user_action_time = time.time()
         
         if action in ["next", "prev"]:
             self._action_lock_time = time.time() + 2.5  
-            with self._state_lock:
-                self._locked_app_id = self._media_state.get("app_id_raw")
-                self._media_state["progress_ms"] = 0
-                self._media_state["last_seen_pos"] = 0
-                self._media_state["last_update_time"] = time.time()
+            self._locked_app_id = self._media_state.get("app_id_raw")
+            self._media_state = {**self._media_state, "progress_ms": 0, "last_seen_pos": 0, "last_update_time": time.time()}
         elif action == "play_pause":
             self.is_playing = not self.is_playing
             self._queue_command("refresh")
 
-        def run_async_cmd(): asyncio.run(self._execute_smtc_cmd(action, payload))
-        threading.Thread(target=run_async_cmd, daemon=True).start()
+        future = asyncio.run_coroutine_threadsafe(self._execute_smtc_cmd(action, payload), self._async_loop)
+        future.add_done_callback(lambda f: f.exception() and logging.error(f"Action {action} failed: {f.exception()}"))
 
     async def _execute_smtc_cmd(self, action, payload=None):
         if not WIN_MEDIA_AVAILABLE: return
-        manager = await GlobalSystemMediaTransportControlsSessionManager.request_async()
+        manager = await self._get_session_manager()
+        # One WinRT snapshot of the sessions serves every lookup below
+        sessions = manager.get_sessions()
         
         target_session = None
         
         if action == "pause_others_and_switch":
-            for s in manager.get_sessions():
+            for s in sessions:
                 if s.source_app_user_model_id != payload:
                     info = s.get_playback_info()
                     if info and info.playback_status == 4:
@@ -1017,51 +1489,116 @@ class UniversalMediaWidget:
             return
             
         if getattr(self, "_locked_app_id", None) and time.time() < self._action_lock_time:
-            for s in manager.get_sessions():
+            for s in sessions:
                 if s.source_app_user_model_id == self._locked_app_id: target_session = s; break
         elif getattr(self, "_forced_app_id", None):
-            for s in manager.get_sessions():
+            for s in sessions:
                 if s.source_app_user_model_id == self._forced_app_id: target_session = s; break
         
         if not target_session:
-            for s in manager.get_sessions():
-                if s.get_playback_info() and s.get_playback_info().playback_status == 4: target_session = s; break
+            for s in sessions:
+                if (info := s.get_playback_info()) and info.playback_status == 4: target_session = s; break
         if not target_session: target_session = manager.get_current_session()
         
         if target_session:
             self._locked_app_id = target_session.source_app_user_model_id
             try:
                 if action == "play_pause": await target_session.try_toggle_play_pause_async()
-                elif action == "next":
+                elif action in ("next", "prev"):
+                    # Skip through the session when it allows it, otherwise fall back to the media key
+                    enabled, skip, vk = (("is_next_enabled", target_session.try_skip_next_async, VK_MEDIA_NEXT_TRACK) if action == "next"
+                                         else ("is_previous_enabled", target_session.try_skip_previous_async, VK_MEDIA_PREV_TRACK))
                     info = target_session.get_playback_info()
-                    if info and getattr(info.controls, "is_next_enabled", True): await target_session.try_skip_next_async()
-                    elif NATIVE_CONTROLS_AVAILABLE: self._send_vol_command(VK_MEDIA_NEXT_TRACK)
-                elif action == "prev":
-                    info = target_session.get_playback_info()
-                    if info and getattr(info.controls, "is_previous_enabled", True): await target_session.try_skip_previous_async()
-                    elif NATIVE_CONTROLS_AVAILABLE: self._send_vol_command(VK_MEDIA_PREV_TRACK) 
+                    if info and getattr(info.controls, enabled, True): await skip()
+                    elif NATIVE_CONTROLS_AVAILABLE: self._send_vol_command(vk)
                 elif action == "seek" and payload is not None:
                     await target_session.try_change_playback_position_async(int(payload * 10000))
+                # Re-read the session now so the result of the click shows without waiting out the poll delay
+                if self._poll_wakeup: self._poll_wakeup.set()
             except Exception as e: logging.error(f"Action {action} failed: {e}")
 
     def _start_background_tasks(self):
         if WIN_MEDIA_AVAILABLE: 
-            threading.Thread(target=self._run_async_media_loop, daemon=True, name="WinMediaLoop").start()
+            future = asyncio.run_coroutine_threadsafe(self._media_poll_loop(), self._async_loop)
+            future.add_done_callback(lambda f: f.exception() and logging.error(f"Media loop stopped: {f.exception()}"))
             
         if IS_WINDOWS:
             # We start the dedicated Win+D thread here
             threading.Thread(target=self._fast_win_d_monitor, daemon=True, name="WinDMonitor").start()
 
-    def _run_async_media_loop(self):
-        asyncio.run(self._media_poll_loop())
+    async def _get_media_props(self, session, shared=False) -> Tuple[Any, bool]:
+        """Returns the session's media properties, reusing the last result until the
+        app raises a properties-changed event or the cached copy goes stale.
+        shared marks an app id that currently owns several sessions (e.g. two browser tabs);
+        the cache can't tell those apart, so they are always read fresh."""
+        app_id = session.source_app_user_model_id
+        if shared:
+            # Only report a refresh (which re-reads the thumbnail) when the tab's track actually differs
+            info = await session.try_get_media_properties_async()
+            seen = (info.title, info.artist)
+            refreshed, self._shared_props_seen[app_id] = self._shared_props_seen.get(app_id) != seen, seen
+            return info, refreshed
+        cached = self._media_props.get(app_id)
+        if cached is None:
+            try:
+                token = session.add_media_properties_changed(lambda sender, args, a=app_id: self._media_props_dirty.add(a))
+            except Exception: token = None
+            cached = self._media_props[app_id] = {"session": session, "token": token, "info": None, "fetched": 0.0}
+        
+        if cached["info"] is not None and app_id not in self._media_props_dirty and time.time() - cached["fetched"] < MEDIA_PROPS_MAX_AGE_S:
+            return cached["info"], False
+        
+        self._media_props_dirty.discard(app_id)
+        cached["info"] = await session.try_get_media_properties_async()
+        cached["fetched"] = time.time()
+        return cached["info"], True
+
+    async def _read_thumbnail(self, thumbnail) -> bytearray:
+        stream = await thumbnail.open_read_async()
+        try:
+            reader = DataReader(stream)
+            try:
+                await reader.load_async(stream.size)
+                buffer = bytearray(stream.size)
+                reader.read_bytes(buffer)
+                return buffer
+            finally: reader.detach_stream(); reader.close()
+        finally: stream.close()
+
+    def _forget_media_props(self, active_ids, shared_ids=()):
+        # Session wrappers are recreated on every get_sessions(), so entries can't be matched to a
+        # session by identity; any add/remove of a session invalidates them all instead
+        drop_all, self._media_sessions_changed = self._media_sessions_changed, False
+        for app_id in [a for a in self._media_props if drop_all or a not in active_ids or a in shared_ids]:
+            cached = self._media_props.pop(app_id)
+            self._media_props_dirty.discard(app_id)
+            if cached["token"] is not None:
+                try: cached["session"].remove_media_properties_changed(cached["token"])
+                except Exception: pass
+
+    async def _get_session_manager(self):
+        """The SMTC manager is agile, so one instance serves both the media loop and control commands."""
+        if self._session_mgr is None:
+            self._session_mgr = await GlobalSystemMediaTransportControlsSessionManager.request_async()
+        return self._session_mgr
 
     async def _media_poll_loop(self):
-        manager = await GlobalSystemMediaTransportControlsSessionManager.request_async()
+        manager = await self._get_session_manager()
         
         last_track_change_time = 0.0
         last_track_title = ""
+        thumb_pending = True
+        cover_title, local_cover = None, None
+        last_rendered_key = None
+        error_delay, last_error = 0.0, None
+        self._poll_wakeup = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        loop.run_in_executor(None, prune_art_cache)
+        try: manager.add_sessions_changed(lambda sender, args: setattr(self, "_media_sessions_changed", True))
+        except Exception: pass
         
         while not self._stop_event.is_set():
+            n_p = False
             try:
                 sessions = manager.get_sessions()
                 
@@ -1073,10 +1610,12 @@ class UniversalMediaWidget:
                     domain, clean_name = get_app_domain_and_name(app_id)
                     available_apps.append((clean_name, app_id, domain))
                 
-                with self._state_lock: self._available_sessions = available_apps
+                if available_apps != self._available_sessions: self._queue_command("sessions", available_apps)
                 
                 if getattr(self, "_forced_app_id", None) and self._forced_app_id not in active_ids:
                     self._forced_app_id = None
+                shared_ids = {a for a in active_ids if active_ids.count(a) > 1}
+                self._forget_media_props(active_ids, shared_ids)
 
                 active_session = None
                 
@@ -1098,13 +1637,15 @@ class UniversalMediaWidget:
                 if active_session:
                     self._locked_app_id = active_session.source_app_user_model_id
                     
-                    info = await active_session.try_get_media_properties_async()
+                    info, props_refreshed = await self._get_media_props(active_session, active_session.source_app_user_model_id in shared_ids)
+                    if props_refreshed: thumb_pending = True
                     playback_info = active_session.get_playback_info()
                     timeline = active_session.get_timeline_properties()
                     
                     n_p = (playback_info.playback_status == 4) if playback_info else False
                     n_title = info.title or ""
                     n_artist = info.artist or ""
+                    track_id = (active_session.source_app_user_model_id, n_title, n_artist)
                     domain, clean_app_name = get_app_domain_and_name(active_session.source_app_user_model_id)
                     
                     n_pos_ms = timeline.position.total_seconds() * 1000 if timeline else 0
@@ -1112,81 +1653,98 @@ class UniversalMediaWidget:
                     
                     if time.time() - self._last_user_action_time < 1.0: n_p = self.is_playing 
                     
-                    pil_image = get_local_cover_art(n_title)
+                    # Resolve the bundled cover once per title instead of stat+decode every tick
+                    if n_title != cover_title:
+                        cover_title, local_cover = n_title, await loop.run_in_executor(None, get_local_cover_art, n_title)
+                    pil_image = local_cover
                     
+                    cur = self._media_state
+                    cur_image, cur_art_key = cur.get("image"), cur.get("art_key")
                     if n_title != last_track_title:
                         last_track_change_time = time.time()
                         last_track_title = n_title
                         n_pos_ms = 0
-                        with self._state_lock: 
-                            self._media_state["image"] = None
-                            self._media_state["last_seen_pos"] = 0
-                            self._media_state["progress_ms"] = 0
+                        # A revisited track shows its last known art right away instead of waiting out the thumbnail window
+                        cur_art_key, cur_image = self._art_by_track.get(track_id, (None, None))
+                        # After a restart the disk copy stands in until the session's thumbnail is read
+                        if cur_image is None and local_cover is None and (cached := await loop.run_in_executor(None, load_cached_art, track_id)):
+                            cur_art_key, cur_image = self._art_by_track[track_id] = cached
                         
                     ignore_new_thumb = (time.time() - last_track_change_time) < 1.5
                     
-                    with self._state_lock:
-                        changed = (
-                            self.is_playing != n_p or 
-                            self._media_state.get("title") != n_title or 
-                            self._media_state.get("app") != clean_app_name
-                        )
+                    # A play-state flip alone goes out as a progress update below, not a new track state
+                    changed = (
+                        cur.get("title") != n_title or 
+                        cur.get("app") != clean_app_name
+                    )
                     
+                    art_key = f"cover:{cover_title}" if local_cover else None
                     if pil_image is None:
-                        pil_image = self._media_state.get("image")
-                        if info.thumbnail and not ignore_new_thumb:
+                        pil_image, art_key = cur_image, cur_art_key
+                        if info.thumbnail and not ignore_new_thumb and (thumb_pending or pil_image is None):
+                            thumb_pending = False
                             try:
-                                stream = await info.thumbnail.open_read_async()
-                                reader = DataReader(stream)
-                                await reader.load_async(stream.size)
-                                buffer = bytearray(stream.size)
-                                reader.read_bytes(buffer)
-                                new_pil = Image.open(io.BytesIO(buffer)).convert("RGBA")
-                                if pil_image is None or new_pil.tobytes() != pil_image.tobytes():
-                                    pil_image = new_pil
+                                buffer = await self._read_thumbnail(info.thumbnail)
+                                # Decoding on the default executor keeps control clicks on this loop responsive meanwhile
+                                new_key, new_pil = await loop.run_in_executor(None, self._album_art_cache.get_or_decode, buffer)
+                                del buffer
+                                if pil_image is None or new_key != art_key:
+                                    pil_image, art_key = new_pil, new_key
                                     changed = True
+                                if self._art_by_track.get(track_id, (None, None))[0] != new_key:
+                                    loop.run_in_executor(None, store_cached_art, track_id, new_key, new_pil)
+                                self._art_by_track[track_id] = (new_key, new_pil)
                             except Exception: pass
                     else:
-                        if self._media_state.get("image") is None: changed = True
+                        if cur_image is None: changed = True
                     
                     if changed:
                         track_data = {
                             "title": n_title or "Unknown", "artist": n_artist or "Unknown",
                             "app": clean_app_name, "app_domain": domain, "app_id_raw": active_session.source_app_user_model_id,
-                            "image": pil_image, "progress_ms": n_pos_ms, "duration_ms": n_dur_ms, 
+                            "image": pil_image, "art_key": art_key, "progress_ms": n_pos_ms, "duration_ms": n_dur_ms, 
                             "last_update_time": time.time(), "last_seen_pos": n_pos_ms
                         }
                         
-                        if pil_image and n_title and not any(t["title"] == n_title for t in self._song_history):
-                            self._song_history.insert(0, track_data)
-                            if len(self._song_history) > 10: self._song_history.pop()
+                        rendered_key = (art_key, self.widget_width, self.widget_height)
+                        if pil_image is not None and art_key and not DISABLE_IMAGES and rendered_key != last_rendered_key:
+                            # Posted ahead of the state so the redraw that follows finds the images ready
+                            self._queue_command("art", await loop.run_in_executor(None, self._prerender_art, pil_image, art_key))
+                            last_rendered_key = rendered_key
+                        self._queue_command("state", (track_data, n_p, bool(pil_image and n_title)))
+                    elif cur:
+                        updates = {"duration_ms": n_dur_ms}
+                        current_last_seen = cur.get("last_seen_pos", -1)
+                        current_interpolated = interpolate_progress_ms(cur, n_p, time.time())
                         
-                        with self._state_lock:
-                            self.is_playing = n_p
-                            self._media_state = track_data
-                        self._queue_command("refresh")
-                    else:
-                        with self._state_lock:
-                            self.is_playing = n_p
-                            if self._media_state:
-                                current_last_seen = self._media_state.get("last_seen_pos", -1)
-                                current_interpolated = self._media_state.get("progress_ms", 0) + ((time.time() - self._media_state.get("last_update_time", time.time())) * 1000 if n_p else 0)
-                                
-                                if n_pos_ms != current_last_seen or abs(n_pos_ms - current_interpolated) > 2000:
-                                    self._media_state["progress_ms"] = n_pos_ms
-                                    self._media_state["last_update_time"] = time.time()
-                                    self._media_state["last_seen_pos"] = n_pos_ms
-                                    
-                                self._media_state["duration_ms"] = n_dur_ms
+                        if n_pos_ms != current_last_seen or abs(n_pos_ms - current_interpolated) > 2000:
+                            updates.update(progress_ms=n_pos_ms, last_update_time=time.time(), last_seen_pos=n_pos_ms)
+                        
+                        if n_p != self.is_playing or any(cur.get(k) != v for k, v in updates.items()):
+                            self._queue_command("progress", (updates, n_p))
                 else:
                     if self.is_playing or self._media_state:
-                        with self._state_lock:
-                            self.is_playing = False
-                            self._media_state = {}
-                        self._queue_command("refresh")
+                        self._queue_command("state", ({}, False, False))
+                # One clean tick ends the backoff, so playback goes straight back to the normal cadence
+                error_delay, last_error = 0.0, None
                         
-            except Exception as e: logging.error(f"Media loop error: {e}")
-            await asyncio.sleep(0.3) 
+            except Exception as e:
+                # An outage repeats the same failure every tick; log it once per streak, not once per poll
+                if repr(e) != last_error: logging.error(f"Media loop error: {e}")
+                last_error = repr(e)
+                # Repeated failures (e.g. the media service restarting) double the wait instead of spinning
+                error_delay = min(max(error_delay * 2, IDLE_POLL_DELAY_S), MEDIA_ERROR_MAX_DELAY_S)
+            
+            # Nothing moves while paused, so poll slowly unless the user just interacted
+            recently_used = time.time() - self._last_user_action_time < 3.0
+            delay = MEDIA_POLL_DELAY_S if n_p or recently_used else IDLE_POLL_DELAY_S
+            if n_p and (cur := self._media_state):
+                # Wake just after the expected track end so the next title lands without waiting out a tick
+                remaining_s = (cur.get("duration_ms", 0) - interpolate_progress_ms(cur, True, time.time())) / 1000
+                if 0 < remaining_s < delay: delay = remaining_s + 0.05
+            try: await asyncio.wait_for(self._poll_wakeup.wait(), max(delay, error_delay))
+            except asyncio.TimeoutError: pass
+            self._poll_wakeup.clear()
 
 def main():
     root = tk.Tk()